@@ -0,0 +1,48 @@
+"""Shared helpers for command-line entry points."""
+
+import click
+
+from track_github_issues.tracker import GitHubIssueTracker
+
+
+def parse_comma_list(ctx, param, value):
+    if not value:
+        return []
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
+def common_options(command):
+    """Apply the shared tracker options to a click command."""
+    options = [
+        click.option(
+            '--users',
+            required=True,
+            callback=parse_comma_list,
+            help='Comma-separated list of GitHub usernames',
+        ),
+        click.option(
+            '--orgs',
+            default='',
+            callback=parse_comma_list,
+            help='Comma-separated list of organizations',
+        ),
+        click.option('--per-page', default=100, type=int, help='Results per page'),
+        click.option(
+            '--page-limit', default=10, type=int, help='Number of pages to fetch'
+        ),
+        click.option('--gh-token', envvar='GH_TOKEN', help='GitHub API Token'),
+    ]
+    for option in reversed(options):
+        command = option(command)
+    return command
+
+
+def build_tracker(users, orgs, per_page, page_limit, gh_token) -> GitHubIssueTracker:
+    """Construct a tracker from the shared CLI options."""
+    return GitHubIssueTracker(
+        users=users,
+        orgs=orgs,
+        per_page=per_page,
+        page_limit=page_limit,
+        gh_token=gh_token,
+    )
@@ -1,27 +1,28 @@
-import click
+import logging
+import sys
 
-from track_github_issues.tracker import GitHubIssueTracker
+import click
 
+from track_github_issues._cli_common import build_tracker, common_options
 
-def parse_comma_list(ctx, param, value):
-    if not value:
-        return []
-    return [item.strip() for item in value.split(',') if item.strip()]
+logger = logging.getLogger(__name__)
 
 
 def run_tracker(users, orgs, per_page, page_limit, gh_token):
     """
     Core logic to track issues.
     """
-    print(f'Tracking issues for users: {users}')
-    print(f'Filtering by organizations: {orgs}')
-    print(f'Settings: per_page={per_page}, page_limit={page_limit}')
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stderr)
+
+    logger.info('Tracking issues for users: %s', users)
+    logger.info('Filtering by organizations: %s', orgs)
+    logger.info('Settings: per_page=%s, page_limit=%s', per_page, page_limit)
 
     if not gh_token:
         click.echo('Error: No GitHub token provided.', err=True)
         return
 
-    tracker = GitHubIssueTracker(
+    tracker = build_tracker(
         users=users,
         orgs=orgs,
         per_page=per_page,
@@ -32,21 +33,7 @@ def run_tracker(users, orgs, per_page, page_limit, gh_token):
 
 
 @click.command()
-@click.option(
-    '--users',
-    required=True,
-    callback=parse_comma_list,
-    help='Comma-separated list of GitHub usernames',
-)
-@click.option(
-    '--orgs',
-    default='',
-    callback=parse_comma_list,
-    help='Comma-separated list of organizations',
-)
-@click.option('--per-page', default=100, type=int, help='Results per page')
-@click.option('--page-limit', default=10, type=int, help='Number of pages to fetch')
-@click.option('--gh-token', envvar='GH_TOKEN', help='GitHub API Token')
+@common_options
 def main(users, orgs, per_page, page_limit, gh_token):
     """Track assigned GitHub issues."""
     run_tracker(
@@ -1,10 +1,74 @@
 """Module for tracking GitHub issues across organizations."""
 
+import asyncio
+import functools
+import json
+import logging
 import os
+import random
 import re
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 
-import requests
+import httpx
+
+logger = logging.getLogger(__name__)
+
+_CACHE_FILE = '.github_issue_tracker_cache.json'
+
+_MAX_RETRIES = 3
+
+# Sleep until the rate-limit window resets once fewer than 1% of the
+# limit remains; derived from each response's own X-RateLimit-Limit
+# since limits range from 30/min (search) to 5000/hr (core)
+_RATE_LIMIT_FLOOR_DIVISOR = 100
+
+_ORIG_URL_RE = re.compile(r'\*\*Original Issue:\*\* (https://github\.com/[^\s)]+)')
+_REPO_URL_RE = re.compile(r'github\.com[:/]([^/]+)/([^/.]+)')
+_REPO_API_RE = re.compile(r'/repos/([^/]+/[^/]+)')
+_ISSUE_URL_RE = re.compile(r'github\.com/([^/]+)/([^/]+)/issues/(\d+)')
+_PAGE_PARAM_RE = re.compile(r'[?&]page=(\d+)')
+
+
+@functools.lru_cache(maxsize=1)
+def _repo_info() -> tuple[str, str] | None:
+    """Resolve the repository owner and name from the environment or git.
+
+    Memoized because the value never changes within a run and the git
+    fallback spawns a subprocess.
+    """
+    # GitHub Actions also exports the owner and name separately
+    owner = os.environ.get('GITHUB_REPOSITORY_OWNER')
+    name = os.environ.get('GITHUB_REPOSITORY_NAME')
+    if owner and name:
+        return owner, name
+
+    # Joined form, available in GitHub Actions
+    github_repo = os.environ.get('GITHUB_REPOSITORY')
+    if github_repo and '/' in github_repo:
+        owner, name = github_repo.split('/', 1)
+        return owner, name
+
+    # Fallback: get from git remote
+    try:
+        import subprocess
+
+        result = subprocess.run(
+            ['git', 'remote', 'get-url', 'origin'],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        remote_url = result.stdout.strip()
+        # Parse GitHub URL (https or ssh)
+        match = _REPO_URL_RE.search(remote_url)
+        if match:
+            return match.group(1), match.group(2)
+    except Exception as e:
+        logger.error('Error getting repo info from git: %s', e)
+
+    return None
 
 
 class GitHubIssueTracker:
@@ -30,60 +94,195 @@ class GitHubIssueTracker:
             'X-GitHub-Api-Version': '2022-11-28',
         }
 
-        self.session = requests.Session()
-        self.session.headers.update(self.headers)
+        # HTTP/2 multiplexes concurrent requests over one TCP+TLS
+        # connection; follow redirects as requests did, e.g. 301s for
+        # issues in renamed or transferred repositories
+        self.session = httpx.Client(
+            http2=True,
+            headers=self.headers,
+            timeout=30.0,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+        )
+
+        # ETag cache so unchanged responses cost a 304 instead of a full
+        # download (304s do not count against the primary rate limit)
+        self._cache = self._load_cache()
 
         # Get repository information from environment or API
         self.repo_owner, self.repo_name = self._get_repo_info()
-        print(f'Repository: {self.repo_owner}/{self.repo_name}')
+        logger.info('Repository: %s/%s', self.repo_owner, self.repo_name)
 
     def _get_repo_info(self) -> tuple[str, str]:
-        """Get repository owner and name from environment or GitHub API."""
-        # Try to get from GITHUB_REPOSITORY env var first (available in GitHub Actions)
-        github_repo = os.environ.get('GITHUB_REPOSITORY')
-        if github_repo and '/' in github_repo:
-            owner, name = github_repo.split('/', 1)
-            return owner, name
-
-        # Fallback: get from git remote
+        """Get repository owner and name from environment or git."""
+        info = _repo_info()
+        if info:
+            return info
+
+        logger.error('Could not determine repository information')
+        sys.exit(1)
+
+    def _load_cache(self) -> dict:
+        """Load the persisted ETag cache, if any."""
+        try:
+            with open(_CACHE_FILE) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_cache(self):
+        """Persist the ETag cache atomically."""
+        tmp_path = f'{_CACHE_FILE}.tmp'
         try:
-            import subprocess
+            with open(tmp_path, 'w') as f:
+                json.dump(self._cache, f)
+            os.replace(tmp_path, _CACHE_FILE)
+        except OSError as e:
+            logger.error('Error saving ETag cache: %s', e)
+
+    def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Issue a request with retries and rate-limit-aware back-off."""
+        response = None
+        for attempt in range(_MAX_RETRIES + 1):
+            response = self.session.request(method, url, **kwargs)
+
+            # Throttle before this resource's rate limit runs out
+            remaining = response.headers.get('X-RateLimit-Remaining', '')
+            limit = response.headers.get('X-RateLimit-Limit', '')
+            reset = response.headers.get('X-RateLimit-Reset', '')
+            if (
+                remaining.isdigit()
+                and limit.isdigit()
+                and reset.isdigit()
+                and int(remaining) < int(limit) // _RATE_LIMIT_FLOOR_DIVISOR
+            ):
+                wait = max(int(reset) - time.time(), 0)
+                if wait:
+                    logger.warning('Rate limit nearly exhausted, sleeping %.0fs', wait)
+                    time.sleep(wait)
+
+            # Back off on primary (429) and secondary (403 + Retry-After)
+            # rate limits
+            retry_after = response.headers.get('Retry-After', '')
+            if response.status_code == 429 or (
+                response.status_code == 403 and retry_after
+            ):
+                if attempt == _MAX_RETRIES:
+                    break
+                delay = (
+                    int(retry_after)
+                    if retry_after.isdigit()
+                    else 2**attempt + random.random()
+                )
+                logger.warning('Rate limited, retrying in %.0fs', delay)
+                time.sleep(delay)
+                continue
 
-            result = subprocess.run(
-                ['git', 'remote', 'get-url', 'origin'],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            remote_url = result.stdout.strip()
-            # Parse GitHub URL (https or ssh)
-            match = re.search(r'github\.com[:/]([^/]+)/([^/.]+)', remote_url)
-            if match:
-                return match.group(1), match.group(2)
+            break
+
+        return response
+
+    async def _async_request(
+        self, session: httpx.AsyncClient, method: str, url: str, **kwargs
+    ) -> httpx.Response:
+        """Async counterpart of _request with the same back-off rules."""
+        response = None
+        for attempt in range(_MAX_RETRIES + 1):
+            response = await session.request(method, url, **kwargs)
+
+            # Throttle before this resource's rate limit runs out
+            remaining = response.headers.get('X-RateLimit-Remaining', '')
+            limit = response.headers.get('X-RateLimit-Limit', '')
+            reset = response.headers.get('X-RateLimit-Reset', '')
+            if (
+                remaining.isdigit()
+                and limit.isdigit()
+                and reset.isdigit()
+                and int(remaining) < int(limit) // _RATE_LIMIT_FLOOR_DIVISOR
+            ):
+                wait = max(int(reset) - time.time(), 0)
+                if wait:
+                    logger.warning('Rate limit nearly exhausted, sleeping %.0fs', wait)
+                    await asyncio.sleep(wait)
+
+            # Back off on primary (429) and secondary (403 + Retry-After)
+            # rate limits
+            retry_after = response.headers.get('Retry-After', '')
+            if response.status_code == 429 or (
+                response.status_code == 403 and retry_after
+            ):
+                if attempt == _MAX_RETRIES:
+                    break
+                delay = (
+                    int(retry_after)
+                    if retry_after.isdigit()
+                    else 2**attempt + random.random()
+                )
+                logger.warning('Rate limited, retrying in %.0fs', delay)
+                await asyncio.sleep(delay)
+                continue
+
+            break
+
+        return response
+
+    def _cached_get(
+        self, url: str, params: dict | None = None
+    ) -> tuple[dict | list | None, dict[str, str]]:
+        """GET a URL with an ETag conditional request.
+
+        Returns the parsed body and the response's link relations,
+        serving both from the cache when the server answers 304.
+        """
+        key = url
+        if params:
+            key += '?' + '&'.join(f'{k}={params[k]}' for k in sorted(params))
+        entry = self._cache.get(key)
+
+        headers = {}
+        if entry and entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+
+        try:
+            response = self._request('GET', url, params=params, headers=headers)
         except Exception as e:
-            print(f'Error getting repo info from git: {e}')
+            logger.error('Error fetching %s: %s', url, e)
+            return None, {}
 
-        print('Error: Could not determine repository information')
-        sys.exit(1)
+        if response.status_code == 304 and entry:
+            return entry['body'], entry.get('links', {})
+
+        if response.status_code == 200:
+            body = response.json()
+            links = {rel: link['url'] for rel, link in response.links.items()}
+            etag = response.headers.get('ETag')
+            if etag:
+                self._cache[key] = {'etag': etag, 'body': body, 'links': links}
+            return body, links
+
+        logger.error('Error fetching %s: %s', url, response.status_code)
+        return None, {}
 
     def _get_repo_name_from_url(self, repo_url: str) -> str:
         """Extract repository name from API URL."""
         # Format: https://api.github.com/repos/owner/repo
-        match = re.search(r'/repos/([^/]+/[^/]+)', repo_url)
+        match = _REPO_API_RE.search(repo_url)
         return match.group(1) if match else repo_url
 
     def _extract_original_issue_url(self, body: str | None) -> str | None:
         """Extract original issue URL from tracking issue body."""
         if not body:
             return None
-        match = re.search(
-            r'\*\*Original Issue:\*\* (https://github\.com/[^\s)]+)', body
-        )
+        # Tracking issues put the Original Issue line first, so reject
+        # foreign bodies cheaply and never scan past the header
+        if not body.startswith('**Original Issue:**'):
+            return None
+        match = _ORIG_URL_RE.search(body[:256])
         return match.group(1) if match else None
 
     def _parse_issue_url(self, url: str) -> dict[str, str] | None:
         """Parse GitHub issue URL into components."""
-        match = re.search(r'github\.com/([^/]+)/([^/]+)/issues/(\d+)', url)
+        match = _ISSUE_URL_RE.search(url)
         if match:
             return {
                 'owner': match.group(1),
@@ -98,107 +297,212 @@ class GitHubIssueTracker:
         if not parsed:
             return False
 
-        try:
-            response = self.session.get(
-                f'https://api.github.com/repos/{parsed["owner"]}/'
-                f'{parsed["repo"]}/issues/{parsed["issue_number"]}'
-            )
-            if response.status_code == 200:
-                issue = response.json()
-                return issue.get('state') == 'closed'
-        except Exception as e:
-            print(f'Error checking issue {issue_url}: {e}')
+        issue, _ = self._cached_get(
+            f'https://api.github.com/repos/{parsed["owner"]}/'
+            f'{parsed["repo"]}/issues/{parsed["issue_number"]}'
+        )
+        if issue:
+            return issue.get('state') == 'closed'
 
         return False
 
-    def get_assigned_issues(self) -> list[dict]:
-        """Get all issues assigned to configured users."""
-        all_issues = []
-
-        for username in self.users:
-            print(f'Fetching issues for user: {username}')
+    def _batch_get_issue_states(self, urls: list[str]) -> dict[str, str]:
+        """Get the states of many issues with batched GraphQL queries."""
+        states: dict[str, str] = {}
 
-            # Build search query
-            query_parts = ['is:issue', 'is:open', f'assignee:{username}']
+        parsed_urls = [
+            (url, parsed) for url in urls if (parsed := self._parse_issue_url(url))
+        ]
 
-            # Add organization filter if specified
-            if self.organizations:
-                org_filter = ' '.join([f'org:{org}' for org in self.organizations])
-                query_parts.append(f'{org_filter}')
+        # GraphQL allows aliased sub-queries, so the states of up to 100
+        # issues can be fetched with a single API call
+        for start in range(0, len(parsed_urls), 100):
+            chunk = parsed_urls[start : start + 100]
+            fields = [
+                f'i{index}: repository('
+                f'owner: "{parsed["owner"]}", name: "{parsed["repo"]}") '
+                f'{{ issue(number: {parsed["issue_number"]}) {{ state }} }}'
+                for index, (_, parsed) in enumerate(chunk)
+            ]
+            query = f'query {{ {" ".join(fields)} }}'
+
+            data = None
+            try:
+                response = self._request(
+                    'POST', 'https://api.github.com/graphql', json={'query': query}
+                )
+                if response.status_code == 200:
+                    data = response.json().get('data') or {}
+                else:
+                    logger.error(
+                        'Error batch checking issue states: %s',
+                        response.status_code,
+                    )
+            except Exception as e:
+                logger.error('Error batch checking issue states: %s', e)
+
+            if data is None:
+                # Degrade to per-issue REST checks so a failed batch does
+                # not leave every tracking issue in the chunk open
+                for url, _ in chunk:
+                    if self._is_original_issue_closed(url):
+                        states[url] = 'CLOSED'
+                continue
 
-            search_query = ' '.join(query_parts)
+            for index, (url, _) in enumerate(chunk):
+                repository = data.get(f'i{index}') or {}
+                issue = repository.get('issue') or {}
+                if issue.get('state'):
+                    states[url] = issue['state']
 
-            # Calculate effective limit
-            effective_limit = min(self.per_page * self.page_limit, 1000)
+        return states
 
-            # Search issues
+    async def _search_issues_page(
+        self,
+        session: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        params: dict,
+        page: int,
+    ) -> dict:
+        """Fetch a single page of search results."""
+        # The semaphore bounds concurrency to respect the search rate limit
+        async with semaphore:
             try:
-                response = self.session.get(
+                response = await self._async_request(
+                    session,
+                    'GET',
                     'https://api.github.com/search/issues',
-                    params={
-                        'q': search_query,
-                        'per_page': effective_limit,
-                        'sort': 'updated',
-                        'order': 'desc',
-                    },
+                    params={**params, 'page': page},
                 )
                 if response.status_code == 200:
-                    data = response.json()
-                    all_issues.extend(data.get('items', []))
-                else:
-                    print(f'Error searching issues: {response.status_code}')
+                    return response.json()
+                logger.error('Error searching issues: %s', response.status_code)
             except Exception as e:
-                print(f'Error fetching assigned issues: {e}')
+                logger.error('Error fetching assigned issues: %s', e)
 
-        # Remove duplicates by issue ID
-        unique_issues = {issue['id']: issue for issue in all_issues}.values()
+        return {}
+
+    async def _search_assigned_issues(
+        self,
+        session: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+    ) -> list[dict]:
+        """Search open issues assigned to any configured user, page by page."""
+        logger.info('Fetching issues for users: %s', ', '.join(self.users))
+
+        # Build search query; comma-separated assignees act as an OR, so
+        # one search covers every user
+        query_parts = ['is:issue', 'is:open', f'assignee:{",".join(self.users)}']
+
+        # Add organization filter if specified
+        if self.organizations:
+            org_filter = ' '.join([f'org:{org}' for org in self.organizations])
+            query_parts.append(f'{org_filter}')
+
+        search_query = ' '.join(query_parts)
+
+        # The search endpoint caps per_page at 100, so honouring
+        # page_limit requires real pagination
+        per_page = min(self.per_page, 100)
+        params = {
+            'q': search_query,
+            'per_page': per_page,
+            'sort': 'updated',
+            'order': 'desc',
+        }
 
-        # Filter out issues from the current repository
+        data = await self._search_issues_page(session, semaphore, params, 1)
+        items = list(data.get('items', []))
+        if len(items) < per_page:
+            return items
+
+        # The first response reports the total, so the remaining pages
+        # can be fetched in parallel (search serves at most 1000 results)
+        total = min(data.get('total_count', 0), 1000)
+        last_page = min(-(-total // per_page), self.page_limit)
+        if last_page > 1:
+            pages = await asyncio.gather(
+                *[
+                    self._search_issues_page(session, semaphore, params, page)
+                    for page in range(2, last_page + 1)
+                ]
+            )
+            for page_data in pages:
+                items.extend(page_data.get('items', []))
+
+        return items
+
+    async def _async_get_assigned_issues(self) -> list[dict]:
+        """Fetch assigned issues for all users concurrently."""
+        semaphore = asyncio.Semaphore(10)
+        async with httpx.AsyncClient(
+            http2=True,
+            headers=self.headers,
+            timeout=30.0,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=10),
+        ) as session:
+            all_issues = await self._search_assigned_issues(session, semaphore)
+
+        # A single search cannot return duplicates, so only filter out
+        # issues from the current repository
         current_repo_url = (
             f'https://api.github.com/repos/{self.repo_owner}/{self.repo_name}'
         )
         filtered_issues = [
             issue
-            for issue in unique_issues
+            for issue in all_issues
             if issue.get('repository_url') != current_repo_url
         ]
 
         return filtered_issues
 
+    def get_assigned_issues(self) -> list[dict]:
+        """Get all issues assigned to configured users."""
+        return asyncio.run(self._async_get_assigned_issues())
+
+    def _get_tracking_issues_page(self, page: int) -> tuple[list[dict], dict]:
+        """Fetch a single page of tracking issues and its link relations."""
+        issues, links = self._cached_get(
+            f'https://api.github.com/repos/{self.repo_owner}/{self.repo_name}/issues',
+            params={
+                'state': 'all',
+                'labels': 'tracked-issue',
+                'per_page': min(self.per_page, 100),
+                'page': page,
+            },
+        )
+        return issues if issues is not None else [], links
+
     def get_existing_tracking_issues(self) -> list[dict]:
         """Get existing tracking issues in the current repo."""
-        all_issues = []
-        page = 1
-
-        # Calculate effective limit
-        effective_limit = min(self.per_page * self.page_limit, 1000)
-
-        while page <= self.page_limit:
-            try:
-                response = self.session.get(
-                    f'https://api.github.com/repos/{self.repo_owner}/'
-                    f'{self.repo_name}/issues',
-                    params={
-                        'state': 'all',
-                        'labels': 'tracked-issue',
-                        'per_page': min(self.per_page, 100),
-                        'page': page,
-                    },
-                )
-                if response.status_code == 200:
-                    issues = response.json()
-                    if not issues:
-                        break
-                    all_issues.extend(issues)
-                    if len(issues) < self.per_page:
-                        break
-                    page += 1
-                else:
-                    print(f'Error fetching tracking issues: {response.status_code}')
+        # Fetch page 1 synchronously to learn the total page count from
+        # the Link header
+        all_issues, links = self._get_tracking_issues_page(1)
+
+        last_link = links.get('last')
+        if last_link:
+            # Fan out the remaining pages concurrently
+            match = _PAGE_PARAM_RE.search(last_link)
+            last_page = min(int(match.group(1)), self.page_limit) if match else 1
+            if last_page > 1:
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    pages = executor.map(
+                        self._get_tracking_issues_page, range(2, last_page + 1)
+                    )
+                    for issues, _ in pages:
+                        all_issues.extend(issues)
+        elif len(all_issues) == min(self.per_page, 100):
+            # No Link header: fall back to walking pages serially
+            page = 2
+            while page <= self.page_limit:
+                issues, _ = self._get_tracking_issues_page(page)
+                if not issues:
                     break
-            except Exception as e:
-                print(f'Error fetching existing tracking issues: {e}')
-                break
+                all_issues.extend(issues)
+                if len(issues) < min(self.per_page, 100):
+                    break
+                page += 1
 
         return all_issues
 
@@ -225,7 +529,8 @@ class GitHubIssueTracker:
 {body}"""
 
         try:
-            response = self.session.post(
+            response = self._request(
+                'POST',
                 f'https://api.github.com/repos/{self.repo_owner}'
                 f'/{self.repo_name}/issues',
                 json={
@@ -238,12 +543,13 @@ class GitHubIssueTracker:
                 new_issue = response.json()
                 return new_issue['number']
             else:
-                print(
-                    f'Error creating tracking issue for {original_url}: '
-                    f'{response.status_code}'
+                logger.error(
+                    'Error creating tracking issue for %s: %s',
+                    original_url,
+                    response.status_code,
                 )
         except Exception as e:
-            print(f'Error creating tracking issue for {original_url}: {e}')
+            logger.error('Error creating tracking issue for %s: %s', original_url, e)
 
         return None
 
@@ -251,14 +557,16 @@ class GitHubIssueTracker:
         """Close a tracking issue."""
         try:
             # Close the issue
-            response = self.session.patch(
+            response = self._request(
+                'PATCH',
                 f'https://api.github.com/repos/{self.repo_owner}'
                 f'/{self.repo_name}/issues/{issue_number}',
                 json={'state': 'closed'},
             )
             if response.status_code == 200:
                 # Add a comment
-                self.session.post(
+                self._request(
+                    'POST',
                     f'https://api.github.com/repos/{self.repo_owner}'
                     f'/{self.repo_name}/issues/{issue_number}/comments',
                     json={
@@ -269,62 +577,63 @@ class GitHubIssueTracker:
                     },
                 )
             else:
-                print(
-                    f'Error closing tracking issue #{issue_number}: '
-                    f'{response.status_code}'
+                logger.error(
+                    'Error closing tracking issue #%s: %s',
+                    issue_number,
+                    response.status_code,
                 )
         except Exception as e:
-            print(f'Error closing tracking issue #{issue_number}: {e}')
+            logger.error('Error closing tracking issue #%s: %s', issue_number, e)
 
-    def run(self):
-        """Main execution method."""
-        print('Starting issue sync...')
-
-        # Get all assigned issues
-        assigned_issues = self.get_assigned_issues()
-        print(f'Found {len(assigned_issues)} assigned issues across organizations')
+    def _create_missing_tracking_issues(
+        self, assigned_issues: list[dict], tracking_by_url: dict[str, dict]
+    ) -> set[str]:
+        """Create tracking issues for assigned issues that lack one.
 
-        # Get existing tracking issues
-        tracking_issues = self.get_existing_tracking_issues()
-        print(f'Found {len(tracking_issues)} existing tracking issues in this repo')
-
-        # Track processed URLs
+        Returns the set of original URLs seen among the assigned issues.
+        """
         processed_urls: set[str] = set()
-
-        # Process assigned issues: create tracking issues as needed
+        to_create = []
         for issue in assigned_issues:
             original_url = issue['html_url']
             processed_urls.add(original_url)
 
             # Check if tracking issue exists
-            existing_tracking = None
-            for tracking in tracking_issues:
-                tracking_body = tracking.get('body', '')
-                if original_url in tracking_body:
-                    existing_tracking = tracking
-                    break
+            existing_tracking = tracking_by_url.get(original_url)
 
             if not existing_tracking:
-                # Create new tracking issue
-                print(f'Creating tracking issue for: {original_url}')
-                issue_number = self.create_tracking_issue(issue)
-                if issue_number:
-                    print(f'Created tracking issue #{issue_number}')
+                logger.debug('Creating tracking issue for: %s', original_url)
+                to_create.append(issue)
             else:
-                print(
-                    f'Tracking issue exists for: {original_url} '
-                    f'(issue #{existing_tracking["number"]})'
+                logger.debug(
+                    'Tracking issue exists for: %s (issue #%s)',
+                    original_url,
+                    existing_tracking['number'],
                 )
 
-        # Close tracking issues for which the original issue is closed or no
-        # longer assigned
-        print('Checking for tracking issues to close...')
-        for tracking in tracking_issues:
-            if tracking['state'] != 'open':
-                continue
+        # Create the independent tracking issues concurrently; bounded
+        # workers plus the back-off in _request keep us under the
+        # content-creation rate limit
+        if to_create:
+            with ThreadPoolExecutor(max_workers=5) as executor:
+                for issue_number in executor.map(self.create_tracking_issue, to_create):
+                    if issue_number:
+                        logger.info('Created tracking issue #%s', issue_number)
+
+        return processed_urls
 
-            original_url = self._extract_original_issue_url(tracking.get('body'))
-            if not original_url:
+    def _close_stale_tracking_issues(
+        self,
+        tracking_urls: list[tuple[dict, str | None]],
+        processed_urls: set[str],
+    ):
+        """Close open tracking issues whose original issue is closed."""
+        logger.info('Checking for tracking issues to close...')
+        candidates = []
+        # Walk all tracking issues, not the index, so duplicates
+        # referencing the same original issue are each closed
+        for tracking, original_url in tracking_urls:
+            if not original_url or tracking['state'] != 'open':
                 continue
 
             # Check if this issue was in our processed list
@@ -332,12 +641,59 @@ class GitHubIssueTracker:
                 # Issue is still assigned, keep it open
                 continue
 
-            # Check if original issue is closed
-            if self._is_original_issue_closed(original_url):
-                print(
-                    f'Closing tracking issue #{tracking["number"]} - original issue '
-                    'is closed'
+            candidates.append((tracking, original_url))
+
+        # Check all candidate original issues in one batched call
+        # (deduplicated, since duplicates share a URL)
+        states = self._batch_get_issue_states(list({url for _, url in candidates}))
+        to_close = []
+        for tracking, original_url in candidates:
+            if states.get(original_url) == 'CLOSED':
+                logger.info(
+                    'Closing tracking issue #%s - original issue is closed',
+                    tracking['number'],
                 )
-                self.close_tracking_issue(tracking['number'])
+                to_close.append(tracking['number'])
+
+        # Close the tracking issues concurrently as well
+        if to_close:
+            with ThreadPoolExecutor(max_workers=5) as executor:
+                list(executor.map(self.close_tracking_issue, to_close))
+
+    def run(self):
+        """Main execution method."""
+        logger.info('Starting issue sync...')
+
+        # Get all assigned issues
+        assigned_issues = self.get_assigned_issues()
+        logger.info(
+            'Found %d assigned issues across organizations', len(assigned_issues)
+        )
+
+        # Get existing tracking issues
+        tracking_issues = self.get_existing_tracking_issues()
+        logger.info(
+            'Found %d existing tracking issues in this repo', len(tracking_issues)
+        )
+
+        # Extract each tracking issue's original URL once
+        tracking_urls = [
+            (tracking, self._extract_original_issue_url(tracking.get('body')))
+            for tracking in tracking_issues
+        ]
+
+        # Index tracking issues by the original issue URL they reference;
+        # only the create-phase lookup uses this, since duplicates
+        # referencing the same original issue collapse into one entry
+        tracking_by_url: dict[str, dict] = {
+            url: tracking for tracking, url in tracking_urls if url
+        }
+
+        # Create tracking issues as needed, then close the stale ones
+        processed_urls = self._create_missing_tracking_issues(
+            assigned_issues, tracking_by_url
+        )
+        self._close_stale_tracking_issues(tracking_urls, processed_urls)
 
-        print('Issue sync completed!')
+        self._save_cache()
+        logger.info('Issue sync completed!')